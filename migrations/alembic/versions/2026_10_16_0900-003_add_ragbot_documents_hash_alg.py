@@ -0,0 +1,30 @@
+"""Add hash_alg column to ragbot_documents
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Record which algorithm produced content_hash. Existing rows were hashed
+    # with SHA-256; the file watcher rehashes them with BLAKE3 as it sees them.
+    op.add_column(
+        'ragbot_documents',
+        sa.Column('hash_alg', sa.String(length=16), nullable=False, server_default='sha256')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('ragbot_documents', 'hash_alg')
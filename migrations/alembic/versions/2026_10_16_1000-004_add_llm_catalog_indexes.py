@@ -0,0 +1,57 @@
+"""Add composite and partial indexes for active LLM providers and models
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction; building
+    # concurrently avoids locking the catalog tables against writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_llm_models_provider_active', 'llm_models', ['provider_id', 'is_active'],
+            unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_llm_models_active_name', 'llm_models', ['name'],
+            unique=False, postgresql_where=sa.text('is_active'), postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_llm_providers_active_name', 'llm_providers', ['name'],
+            unique=False, postgresql_where=sa.text('is_active'), postgresql_concurrently=True
+        )
+
+        # The composite index leads with provider_id, so this one is redundant
+        op.drop_index(
+            'ix_llm_models_provider_id', table_name='llm_models', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_llm_models_provider_id', 'llm_models', ['provider_id'],
+            unique=False, postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_llm_providers_active_name', table_name='llm_providers', postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_llm_models_active_name', table_name='llm_models', postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_llm_models_provider_active', table_name='llm_models', postgresql_concurrently=True
+        )
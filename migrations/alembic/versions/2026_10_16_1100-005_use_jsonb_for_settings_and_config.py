@@ -0,0 +1,40 @@
+"""Store profile settings and LLM catalog config as JSONB
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSONB_COLUMNS = [
+    ('profiles', 'settings'),
+    ('llm_providers', 'config'),
+    ('llm_models', 'config'),
+]
+
+
+def upgrade() -> None:
+    # jsonb is stored parsed, so reads skip re-parsing the text and it can be indexed
+    for table, column in JSONB_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+
+    op.create_index(
+        'ix_profiles_settings_gin', 'profiles', ['settings'],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_profiles_settings_gin', table_name='profiles')
+
+    for table, column in JSONB_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
@@ -0,0 +1,42 @@
+"""Store LLM model token prices as integer picodollars
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Numeric(12, 10) prices become bigint picodollars (USD * 10^12); exact for scale <= 12
+    op.add_column('llm_models', sa.Column('cost_per_input_token_pico', sa.BigInteger(), nullable=True))
+    op.add_column('llm_models', sa.Column('cost_per_output_token_pico', sa.BigInteger(), nullable=True))
+    op.execute("""
+        UPDATE llm_models
+        SET cost_per_input_token_pico = round(cost_per_input_token * 1000000000000)::bigint,
+            cost_per_output_token_pico = round(cost_per_output_token * 1000000000000)::bigint
+    """)
+    op.drop_column('llm_models', 'cost_per_input_token')
+    op.drop_column('llm_models', 'cost_per_output_token')
+
+
+def downgrade() -> None:
+    op.add_column('llm_models', sa.Column('cost_per_input_token', sa.Numeric(precision=12, scale=10), nullable=True))
+    op.add_column('llm_models', sa.Column('cost_per_output_token', sa.Numeric(precision=12, scale=10), nullable=True))
+    op.execute("""
+        UPDATE llm_models
+        SET cost_per_input_token = cost_per_input_token_pico / 1000000000000.0,
+            cost_per_output_token = cost_per_output_token_pico / 1000000000000.0
+    """)
+    op.drop_column('llm_models', 'cost_per_input_token_pico')
+    op.drop_column('llm_models', 'cost_per_output_token_pico')
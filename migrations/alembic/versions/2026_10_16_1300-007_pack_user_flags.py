@@ -0,0 +1,42 @@
+"""Pack user status booleans into a flags bitfield
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Bits: 1 = is_active, 2 = is_verified, 4 = is_superuser
+    op.add_column('users', sa.Column('flags', sa.SmallInteger(), nullable=False, server_default='1'))
+    op.execute("""
+        UPDATE users
+        SET flags = (is_active::int | (is_verified::int << 1) | (is_superuser::int << 2))::smallint
+    """)
+    op.drop_column('users', 'is_active')
+    op.drop_column('users', 'is_verified')
+    op.drop_column('users', 'is_superuser')
+
+
+def downgrade() -> None:
+    op.add_column('users', sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'))
+    op.add_column('users', sa.Column('is_verified', sa.Boolean(), nullable=False, server_default='false'))
+    op.add_column('users', sa.Column('is_superuser', sa.Boolean(), nullable=False, server_default='false'))
+    op.execute("""
+        UPDATE users
+        SET is_active = (flags & 1) <> 0,
+            is_verified = (flags & 2) <> 0,
+            is_superuser = (flags & 4) <> 0
+    """)
+    op.drop_column('users', 'flags')
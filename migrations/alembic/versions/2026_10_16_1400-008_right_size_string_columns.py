@@ -0,0 +1,70 @@
+"""Right-size string columns and make user email/username case-insensitive
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+
+    # Users: case-insensitive email/username; citext has no length, so use checks
+    op.alter_column('users', 'email', type_=postgresql.CITEXT(), existing_nullable=False)
+    op.alter_column('users', 'username', type_=postgresql.CITEXT(), existing_nullable=False)
+    op.create_check_constraint('ck_users_email_length', 'users', 'char_length(email) <= 254')
+    op.create_check_constraint('ck_users_username_length', 'users', 'char_length(username) <= 64')
+    op.alter_column(
+        'users', 'hashed_password',
+        type_=sa.String(length=60), existing_type=sa.String(length=255), existing_nullable=False
+    )
+
+    # LLM catalog
+    op.alter_column(
+        'llm_providers', 'api_endpoint',
+        type_=sa.String(length=2048), existing_type=sa.String(length=500), existing_nullable=True
+    )
+    op.alter_column(
+        'llm_providers', 'display_name',
+        type_=sa.String(length=120), existing_type=sa.String(length=200), existing_nullable=False
+    )
+    op.alter_column(
+        'llm_models', 'display_name',
+        type_=sa.String(length=120), existing_type=sa.String(length=200), existing_nullable=False
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'llm_models', 'display_name',
+        type_=sa.String(length=200), existing_type=sa.String(length=120), existing_nullable=False
+    )
+    op.alter_column(
+        'llm_providers', 'display_name',
+        type_=sa.String(length=200), existing_type=sa.String(length=120), existing_nullable=False
+    )
+    op.alter_column(
+        'llm_providers', 'api_endpoint',
+        type_=sa.String(length=500), existing_type=sa.String(length=2048), existing_nullable=True
+    )
+
+    op.alter_column(
+        'users', 'hashed_password',
+        type_=sa.String(length=255), existing_type=sa.String(length=60), existing_nullable=False
+    )
+    op.drop_constraint('ck_users_username_length', 'users', type_='check')
+    op.drop_constraint('ck_users_email_length', 'users', type_='check')
+    op.alter_column('users', 'username', type_=sa.String(length=100), existing_nullable=False)
+    op.alter_column('users', 'email', type_=sa.String(length=255), existing_nullable=False)
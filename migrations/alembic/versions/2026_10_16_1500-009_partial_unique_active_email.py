@@ -0,0 +1,33 @@
+"""Enforce unique email only among active users
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # email is citext, so no lower() expression index is needed
+    op.create_index(
+        'ux_users_email_active', 'users', ['email'],
+        unique=True, postgresql_where=sa.text('(flags & 1) <> 0')
+    )
+    op.drop_index('ix_users_email', table_name='users')
+    op.create_index('ix_users_email', 'users', ['email'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email', table_name='users')
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.drop_index('ux_users_email_active', table_name='users')
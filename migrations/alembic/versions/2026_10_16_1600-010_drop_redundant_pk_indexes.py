@@ -0,0 +1,34 @@
+"""Drop indexes duplicating primary keys on users, profiles and the LLM catalog
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The primary key constraint already provides a unique btree on id
+PK_INDEXES = [
+    ('ix_users_id', 'users'),
+    ('ix_profiles_id', 'profiles'),
+    ('ix_llm_providers_id', 'llm_providers'),
+    ('ix_llm_models_id', 'llm_models'),
+]
+
+
+def upgrade() -> None:
+    for index_name, table_name in PK_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade() -> None:
+    for index_name, table_name in PK_INDEXES:
+        op.create_index(index_name, table_name, ['id'], unique=False)
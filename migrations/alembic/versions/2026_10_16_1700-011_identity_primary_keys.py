@@ -0,0 +1,41 @@
+"""Convert serial primary keys on users, profiles and the LLM catalog to identity columns
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['users', 'profiles', 'llm_providers', 'llm_models']
+
+
+def upgrade() -> None:
+    # Identity sequences hand out ids 50 at a time per session instead of one
+    # nextval() per insert; existing ids are kept and numbering continues after them
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+        op.execute(f"DROP SEQUENCE IF EXISTS {table}_id_seq")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (CACHE 50)")
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE((SELECT max(id) FROM {table}), 0) + 1, false)"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY")
+        op.execute(f"CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(
+            f"SELECT setval('{table}_id_seq', COALESCE((SELECT max(id) FROM {table}), 0) + 1, false)"
+        )
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')")
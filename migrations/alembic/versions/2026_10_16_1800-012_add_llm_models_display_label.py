@@ -0,0 +1,75 @@
+"""Add trigger-maintained display_label to llm_models
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('llm_models', sa.Column('display_label', sa.String(length=243), nullable=True))
+    op.execute("""
+        UPDATE llm_models m
+        SET display_label = p.display_name || ' / ' || m.display_name
+        FROM llm_providers p
+        WHERE p.id = m.provider_id
+    """)
+    op.alter_column('llm_models', 'display_label', nullable=False)
+    op.create_index(op.f('ix_llm_models_display_label'), 'llm_models', ['display_label'], unique=False)
+
+    # Set the label whenever a model is written
+    op.execute("""
+        CREATE FUNCTION llm_models_set_display_label() RETURNS trigger AS $$
+        BEGIN
+            SELECT p.display_name || ' / ' || NEW.display_name
+            INTO NEW.display_label
+            FROM llm_providers p
+            WHERE p.id = NEW.provider_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER llm_models_set_display_label
+        BEFORE INSERT OR UPDATE OF provider_id, display_name ON llm_models
+        FOR EACH ROW EXECUTE FUNCTION llm_models_set_display_label()
+    """)
+
+    # Relabel a provider's models when the provider is renamed
+    op.execute("""
+        CREATE FUNCTION llm_providers_relabel_models() RETURNS trigger AS $$
+        BEGIN
+            UPDATE llm_models
+            SET display_label = NEW.display_name || ' / ' || display_name
+            WHERE provider_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER llm_providers_relabel_models
+        AFTER UPDATE OF display_name ON llm_providers
+        FOR EACH ROW
+        WHEN (OLD.display_name IS DISTINCT FROM NEW.display_name)
+        EXECUTE FUNCTION llm_providers_relabel_models()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER llm_providers_relabel_models ON llm_providers")
+    op.execute("DROP FUNCTION llm_providers_relabel_models()")
+    op.execute("DROP TRIGGER llm_models_set_display_label ON llm_models")
+    op.execute("DROP FUNCTION llm_models_set_display_label()")
+    op.drop_index(op.f('ix_llm_models_display_label'), table_name='llm_models')
+    op.drop_column('llm_models', 'display_label')
@@ -0,0 +1,52 @@
+"""Maintain updated_at with a database trigger
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose models use TimestampMixin
+TABLES = [
+    'users',
+    'profiles',
+    'user_uploads',
+    'conversations',
+    'messages',
+    'llm_providers',
+    'llm_models',
+]
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in TABLES:
+        op.execute(f"""
+            CREATE TRIGGER set_updated_at
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION set_updated_at()
+        """)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER set_updated_at ON {table}")
+
+    op.execute("DROP FUNCTION set_updated_at()")
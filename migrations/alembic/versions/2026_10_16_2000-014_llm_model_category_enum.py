@@ -0,0 +1,45 @@
+"""Store llm_models.category as a Postgres enum
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+model_category = postgresql.ENUM('small', 'medium', 'large', 'reasoning', name='llm_model_category')
+
+
+def upgrade() -> None:
+    model_category.create(op.get_bind())
+
+    # Fails on any category outside the enum; fix such rows before upgrading
+    op.alter_column(
+        'llm_models', 'category',
+        type_=model_category,
+        existing_type=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using='lower(category)::llm_model_category'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'llm_models', 'category',
+        type_=sa.String(length=50),
+        existing_type=model_category,
+        existing_nullable=False,
+        postgresql_using='category::text'
+    )
+
+    model_category.drop(op.get_bind())
@@ -0,0 +1,32 @@
+"""Check that llm_models token limits are positive
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONSTRAINTS = [
+    ('ck_llm_models_max_input_tokens_positive', 'max_input_tokens > 0'),
+    ('ck_llm_models_max_output_tokens_positive', 'max_output_tokens > 0'),
+    ('ck_llm_models_default_max_tokens_positive', 'default_max_tokens > 0'),
+]
+
+
+def upgrade() -> None:
+    for name, condition in CONSTRAINTS:
+        op.create_check_constraint(name, 'llm_models', condition)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(CONSTRAINTS):
+        op.drop_constraint(name, 'llm_models', type_='check')
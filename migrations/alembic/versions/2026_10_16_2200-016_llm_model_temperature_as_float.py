@@ -0,0 +1,37 @@
+"""Store llm_models.default_temperature as double precision
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'llm_models', 'default_temperature',
+        type_=sa.Double(),
+        existing_type=sa.Numeric(precision=3, scale=2),
+        existing_nullable=False,
+        postgresql_using='default_temperature::double precision'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'llm_models', 'default_temperature',
+        type_=sa.Numeric(precision=3, scale=2),
+        existing_type=sa.Double(),
+        existing_nullable=False,
+        postgresql_using='round(default_temperature::numeric, 2)'
+    )
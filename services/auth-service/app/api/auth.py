@@ -1,8 +1,10 @@
 """Authentication API routes."""
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import raiseload
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
 
 from app.core import (
@@ -30,12 +32,31 @@ from shared.models import User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Statements for the hot lookups, built once so each request only binds values.
+# Responses only use User columns, so any relationship access raises instead of
+# issuing a query per user.
+_select_user_by_id = (
+    select(User)
+    .where(User.id == bindparam("user_id"))
+    .options(raiseload("*"))
+)
+# Only active accounts can log in. The is_active predicate matches the
+# ux_users_email_active partial index, and an email shared with deactivated
+# accounts resolves to the single active one.
+_select_user_by_login = (
+    select(User)
+    .where((User.username == bindparam("login")) | (User.email == bindparam("login")))
+    .where(User.is_active)
+    .options(raiseload("*"))
+    .limit(1)
+)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """Get the current authenticated user from JWT token."""
     credentials_exception = HTTPException(
@@ -52,7 +73,8 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(_select_user_by_id, {"user_id": user_id})
+    user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
 
@@ -66,15 +88,18 @@ async def get_current_user(
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserRegister, db: Session = Depends(get_db)):
+async def register(user_data: UserRegister, db: AsyncSession = Depends(get_db)):
     """Register a new user."""
     # Check if user already exists
-    existing_user = db.query(User).filter(
-        (User.email == user_data.email) | (User.username == user_data.username)
-    ).first()
+    result = await db.execute(
+        select(User).where(
+            (User.email == user_data.email) | (User.username == user_data.username)
+        ).limit(1)
+    )
+    existing_user = result.scalar_one_or_none()
 
     if existing_user:
-        if existing_user.email == user_data.email:
+        if existing_user.email.lower() == user_data.email.lower():  # email is citext
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
@@ -96,19 +121,18 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
     )
 
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
 
     return new_user
 
 
 @router.post("/login", response_model=Token)
-async def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
     """Login and get access tokens."""
     # Find user by username or email
-    user = db.query(User).filter(
-        (User.username == user_data.username) | (User.email == user_data.username)
-    ).first()
+    result = await db.execute(_select_user_by_login, {"login": user_data.username})
+    user = result.scalar_one_or_none()
 
     if not user or not verify_password(user_data.password, user.hashed_password):
         raise HTTPException(
@@ -117,15 +141,9 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user"
-        )
-
     # Update last login
-    user.last_login = datetime.utcnow()
-    db.commit()
+    user.last_login = datetime.now(timezone.utc)
+    await db.commit()
 
     # Create tokens
     access_token = create_access_token(data={"sub": user.id, "username": user.username})
@@ -137,7 +155,7 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
 @router.post("/token", response_model=Token)
 async def login_with_form(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """OAuth2 compatible token login (alternative endpoint for OAuth2PasswordBearer)."""
     user_data = UserLogin(username=form_data.username, password=form_data.password)
@@ -145,7 +163,7 @@ async def login_with_form(
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(token_data: RefreshTokenRequest, db: Session = Depends(get_db)):
+async def refresh_token(token_data: RefreshTokenRequest, db: AsyncSession = Depends(get_db)):
     """Refresh access token using refresh token."""
     payload = decode_token(token_data.refresh_token)
 
@@ -164,7 +182,8 @@ async def refresh_token(token_data: RefreshTokenRequest, db: Session = Depends(g
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(_select_user_by_id, {"user_id": user_id})
+    user = result.scalar_one_or_none()
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -188,7 +207,7 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 async def change_password(
     password_data: PasswordChange,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Change user password."""
     # Verify old password
@@ -200,7 +219,7 @@ async def change_password(
 
     # Update password
     current_user.hashed_password = get_password_hash(password_data.new_password)
-    db.commit()
+    await db.commit()
 
     return {"message": "Password changed successfully"}
 
@@ -14,6 +14,8 @@ class Settings:
 
     # Watcher settings
     POLLING_INTERVAL: int = int(os.getenv('POLLING_INTERVAL', '5'))  # seconds
+    DEBOUNCE_SECONDS: float = float(os.getenv('DEBOUNCE_SECONDS', '0.5'))  # quiet period before processing
+    HASH_CACHE_SIZE: int = int(os.getenv('HASH_CACHE_SIZE', '100000'))  # entries, 0 disables caching
 
     # File patterns
     INCLUDE_EXTENSIONS: tuple = ('.md', '.txt')
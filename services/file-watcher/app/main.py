@@ -1,13 +1,14 @@
 """Main file watcher service."""
 import asyncio
-import hashlib
 import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Callable, Dict, Iterator, Optional, Set
 
 import asyncpg
+import blake3
 import structlog
 from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
@@ -24,6 +25,98 @@ structlog.configure(
 )
 logger = structlog.get_logger()
 
+# Content hash algorithm recorded alongside each hash in ragbot_documents.
+# Rows still carrying the legacy 'sha256' value are rehashed on next sight.
+HASH_ALGORITHM = "blake3"
+
+# Insert or update a document and queue it for embedding in a single statement.
+# Size, mtime and hash algorithm are always refreshed so UNCHANGED_HASH_SQL
+# matches the file next time. Embedding state is only reset, and the document
+# only queued, when the row is new, its content hash changed, or it was marked
+# deleted and has reappeared. previous sees the row as it was before this
+# statement; unchanged files return no row. xmax = 0 identifies inserted rows.
+# modified_at is passed as the raw st_mtime float and converted in SQL.
+UPSERT_AND_QUEUE_SQL = """
+    WITH previous AS (
+        SELECT (content_hash IS DISTINCT FROM $2 OR embedding_status = 'deleted') AS changed
+        FROM ragbot_documents
+        WHERE file_path = $1
+    ),
+    upserted AS (
+        INSERT INTO ragbot_documents (
+            file_path, content_hash, hash_alg, file_size, modified_at,
+            embedding_status, metadata, created_at, updated_at
+        )
+        VALUES ($1, $2, $7, $3, to_timestamp($4), 'pending', $5, NOW(), NOW())
+        ON CONFLICT (file_path) DO UPDATE
+        SET content_hash = EXCLUDED.content_hash,
+            hash_alg = EXCLUDED.hash_alg,
+            file_size = EXCLUDED.file_size,
+            modified_at = EXCLUDED.modified_at,
+            embedding_status = CASE WHEN (SELECT changed FROM previous)
+                THEN 'pending' ELSE ragbot_documents.embedding_status END,
+            chunk_count = CASE WHEN (SELECT changed FROM previous)
+                THEN 0 ELSE ragbot_documents.chunk_count END,
+            indexed_at = CASE WHEN (SELECT changed FROM previous)
+                THEN NULL ELSE ragbot_documents.indexed_at END,
+            error_message = CASE WHEN (SELECT changed FROM previous)
+                THEN NULL ELSE ragbot_documents.error_message END,
+            updated_at = NOW()
+        RETURNING id, (xmax = 0) AS inserted
+    ),
+    changed AS (
+        SELECT id, inserted FROM upserted
+        WHERE inserted OR (SELECT changed FROM previous)
+    ),
+    queued AS (
+        INSERT INTO embedding_queue (document_type, document_id, priority, status)
+        SELECT 'ragbot', id, $6, 'pending' FROM changed
+    )
+    SELECT id, inserted FROM changed
+"""
+
+# Returns the stored hash when a file's size and mtime match the database
+# record, letting callers skip rehashing files that have not been touched.
+UNCHANGED_HASH_SQL = """
+    SELECT content_hash, hash_alg
+    FROM ragbot_documents
+    WHERE file_path = $1
+      AND file_size = $2
+      AND modified_at = to_timestamp($3)
+      AND embedding_status <> 'deleted'
+"""
+
+# Records new size and mtime for a file whose content is known to be unchanged,
+# so the next UNCHANGED_HASH_SQL check matches without rehashing.
+REFRESH_METADATA_SQL = """
+    UPDATE ragbot_documents
+    SET file_size = $2,
+        modified_at = to_timestamp($3),
+        updated_at = NOW()
+    WHERE file_path = $1
+"""
+
+# Replaces a legacy hash in place for a file whose metadata is unchanged,
+# without re-queueing it for embedding.
+UPGRADE_HASH_SQL = """
+    UPDATE ragbot_documents
+    SET content_hash = $2,
+        hash_alg = $3
+    WHERE file_path = $1
+"""
+
+
+def compute_file_hash(file_path: str) -> str:
+    """Compute BLAKE3 hash of file content (blocking; run in a worker thread).
+
+    The hash is only used for change detection, so BLAKE3's multithreaded
+    SIMD tree mode is used in place of SHA-256. The digest is 32 bytes, so
+    it still fits the existing 64-character content_hash column.
+    """
+    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    hasher.update_mmap(file_path)
+    return hasher.hexdigest()
+
 
 class RagbotDataWatcher(FileSystemEventHandler):
     """File system event handler for ragbot-data directory."""
@@ -32,7 +125,9 @@ class RagbotDataWatcher(FileSystemEventHandler):
         """Initialize the watcher with a database pool."""
         self.db_pool = db_pool
         self.loop = asyncio.get_event_loop()
-        self.file_hashes = {}  # Cache of file hashes
+        self.file_hashes: OrderedDict[str, str] = OrderedDict()  # LRU cache of file hashes
+        self._pending: Dict[str, asyncio.TimerHandle] = {}  # Debounce timers by path
+        self._tasks: Set[asyncio.Task] = set()  # Keep running handlers referenced
         logger.info("RagbotDataWatcher initialized")
 
     def on_modified(self, event: FileSystemEvent) -> None:
@@ -47,10 +142,7 @@ class RagbotDataWatcher(FileSystemEventHandler):
         logger.info("file_modified", path=event.src_path)
 
         # Schedule async processing
-        asyncio.run_coroutine_threadsafe(
-            self._process_file_change(event.src_path),
-            self.loop
-        )
+        self._schedule(event.src_path, self._process_file_change)
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation events."""
@@ -62,10 +154,7 @@ class RagbotDataWatcher(FileSystemEventHandler):
 
         logger.info("file_created", path=event.src_path)
 
-        asyncio.run_coroutine_threadsafe(
-            self._process_file_change(event.src_path),
-            self.loop
-        )
+        self._schedule(event.src_path, self._process_file_change)
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """Handle file deletion events."""
@@ -77,11 +166,45 @@ class RagbotDataWatcher(FileSystemEventHandler):
 
         logger.info("file_deleted", path=event.src_path)
 
-        asyncio.run_coroutine_threadsafe(
-            self._process_file_deletion(event.src_path),
-            self.loop
+        self._schedule(event.src_path, self._process_file_deletion)
+
+    def _schedule(
+        self,
+        file_path: str,
+        handler: Callable[[str], Awaitable[None]]
+    ) -> None:
+        """Schedule a handler from the observer thread, debounced per path."""
+        self.loop.call_soon_threadsafe(self._debounce, file_path, handler)
+
+    def _debounce(
+        self,
+        file_path: str,
+        handler: Callable[[str], Awaitable[None]]
+    ) -> None:
+        """Restart the quiet-period timer for a path; the latest event wins.
+
+        Editors emit several events per save, so only the last one within
+        DEBOUNCE_SECONDS is processed.
+        """
+        pending = self._pending.pop(file_path, None)
+        if pending is not None:
+            pending.cancel()
+
+        self._pending[file_path] = self.loop.call_later(
+            settings.DEBOUNCE_SECONDS, self._run_handler, file_path, handler
         )
 
+    def _run_handler(
+        self,
+        file_path: str,
+        handler: Callable[[str], Awaitable[None]]
+    ) -> None:
+        """Start the handler once the path has been quiet."""
+        self._pending.pop(file_path, None)
+        task = self.loop.create_task(handler(file_path))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
     def _should_process(self, file_path: str) -> bool:
         """Check if file should be processed."""
         path = Path(file_path)
@@ -97,18 +220,31 @@ class RagbotDataWatcher(FileSystemEventHandler):
 
         return True
 
-    def _compute_file_hash(self, file_path: str) -> str:
-        """Compute SHA-256 hash of file content."""
-        sha256_hash = hashlib.sha256()
+    async def _compute_file_hash(self, file_path: str) -> str:
+        """Compute the content hash of a file without blocking the event loop."""
         try:
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+            return await asyncio.to_thread(compute_file_hash, file_path)
         except Exception as e:
             logger.error("hash_computation_failed", path=file_path, error=str(e))
             return ""
 
+    def _get_cached_hash(self, relative_path: str) -> Optional[str]:
+        """Look up a cached hash, marking it as most recently used."""
+        content_hash = self.file_hashes.get(relative_path)
+        if content_hash is not None:
+            self.file_hashes.move_to_end(relative_path)
+        return content_hash
+
+    def _cache_hash(self, relative_path: str, content_hash: str) -> None:
+        """Store a hash, evicting least recently used entries beyond HASH_CACHE_SIZE."""
+        if settings.HASH_CACHE_SIZE <= 0:
+            return
+
+        self.file_hashes[relative_path] = content_hash
+        self.file_hashes.move_to_end(relative_path)
+        while len(self.file_hashes) > settings.HASH_CACHE_SIZE:
+            self.file_hashes.popitem(last=False)
+
     def _get_relative_path(self, absolute_path: str) -> str:
         """Get path relative to ragbot-data root."""
         try:
@@ -123,91 +259,78 @@ class RagbotDataWatcher(FileSystemEventHandler):
             # Get file info
             file_stat = os.stat(file_path)
             file_size = file_stat.st_size
-            modified_at = datetime.fromtimestamp(file_stat.st_mtime)
+            modified_at = file_stat.st_mtime
+
+            # Get relative path
+            relative_path = self._get_relative_path(file_path)
+
+            # Skip hashing when size and mtime match the stored record
+            async with self.db_pool.acquire() as conn:
+                stored = await conn.fetchrow(
+                    UNCHANGED_HASH_SQL, relative_path, file_size, modified_at
+                )
+            if stored:
+                content_hash = stored['content_hash']
+                if stored['hash_alg'] != HASH_ALGORITHM:
+                    # Unchanged file with a legacy hash - rehash without re-queueing
+                    content_hash = await self._compute_file_hash(file_path)
+                    if not content_hash:
+                        return
+                    async with self.db_pool.acquire() as conn:
+                        await conn.execute(
+                            UPGRADE_HASH_SQL, relative_path, content_hash, HASH_ALGORITHM
+                        )
+                    logger.debug("file_hash_upgraded", path=relative_path, hash_alg=HASH_ALGORITHM)
+
+                self._cache_hash(relative_path, content_hash)
+                logger.debug("file_metadata_unchanged", path=relative_path)
+                return
 
             # Compute content hash
-            content_hash = self._compute_file_hash(file_path)
+            content_hash = await self._compute_file_hash(file_path)
             if not content_hash:
                 return
 
-            # Get relative path
-            relative_path = self._get_relative_path(file_path)
-
             # Check if hash changed
-            cached_hash = self.file_hashes.get(relative_path)
+            cached_hash = self._get_cached_hash(relative_path)
             if cached_hash == content_hash:
+                async with self.db_pool.acquire() as conn:
+                    await conn.execute(REFRESH_METADATA_SQL, relative_path, file_size, modified_at)
                 logger.debug("file_unchanged", path=relative_path, hash=content_hash[:16])
                 return
 
             # Update cache
-            self.file_hashes[relative_path] = content_hash
+            self._cache_hash(relative_path, content_hash)
 
-            # Check database
+            # Upsert the document and queue it for embedding in one round-trip
             async with self.db_pool.acquire() as conn:
-                existing = await conn.fetchrow(
-                    "SELECT id, content_hash, embedding_status FROM ragbot_documents WHERE file_path = $1",
-                    relative_path
-                )
-
-                if existing:
-                    if existing['content_hash'] == content_hash:
-                        logger.debug("file_unchanged_in_db", path=relative_path)
-                        return
-
-                    # File changed - update record and queue for re-embedding
-                    logger.info(
-                        "file_changed",
-                        path=relative_path,
-                        old_hash=existing['content_hash'][:16],
-                        new_hash=content_hash[:16]
-                    )
-
-                    # Update document record
-                    await conn.execute("""
-                        UPDATE ragbot_documents
-                        SET content_hash = $1,
-                            file_size = $2,
-                            modified_at = $3,
-                            embedding_status = 'pending',
-                            chunk_count = 0,
-                            indexed_at = NULL,
-                            error_message = NULL,
-                            updated_at = NOW()
-                        WHERE file_path = $4
-                    """, content_hash, file_size, modified_at, relative_path)
-
-                    # Queue for re-embedding with high priority
-                    await conn.execute("""
-                        INSERT INTO embedding_queue (document_type, document_id, priority, status)
-                        VALUES ('ragbot', $1, 10, 'pending')
-                    """, existing['id'])
-
-                    logger.info("reembedding_queued", path=relative_path, document_id=str(existing['id']))
-
-                else:
-                    # New file - create record and queue for embedding
-                    logger.info("new_file_detected", path=relative_path, size=file_size, hash=content_hash[:16])
-
-                    # Insert document record
-                    document_id = await conn.fetchval("""
-                        INSERT INTO ragbot_documents (
-                            file_path, content_hash, file_size, modified_at,
-                            embedding_status, metadata, created_at, updated_at
-                        )
-                        VALUES ($1, $2, $3, $4, 'pending', $5, NOW(), NOW())
-                        RETURNING id
-                    """, relative_path, content_hash, file_size, modified_at, {
+                row = await conn.fetchrow(
+                    UPSERT_AND_QUEUE_SQL,
+                    relative_path, content_hash, file_size, modified_at, {
                         'detected_by': 'file_watcher',
                         'first_seen': datetime.now().isoformat()
-                    })
-
-                    # Queue for embedding
-                    await conn.execute("""
-                        INSERT INTO embedding_queue (document_type, document_id, priority, status)
-                        VALUES ('ragbot', $1, 10, 'pending')
-                    """, document_id)
+                    },
+                    10,  # High priority for live changes
+                    HASH_ALGORITHM
+                )
 
-                    logger.info("new_file_queued", path=relative_path, document_id=str(document_id))
+            if row is None:
+                logger.debug("file_unchanged_in_db", path=relative_path)
+            elif row['inserted']:
+                logger.info(
+                    "new_file_queued",
+                    path=relative_path,
+                    size=file_size,
+                    hash=content_hash[:16],
+                    document_id=str(row['id'])
+                )
+            else:
+                logger.info(
+                    "reembedding_queued",
+                    path=relative_path,
+                    new_hash=content_hash[:16],
+                    document_id=str(row['id'])
+                )
 
         except Exception as e:
             logger.error("process_file_change_failed", path=file_path, error=str(e), exc_info=True)
@@ -238,89 +361,93 @@ class RagbotDataWatcher(FileSystemEventHandler):
             logger.error("process_file_deletion_failed", path=file_path, error=str(e))
 
 
+def iter_data_files(root: str) -> Iterator[os.DirEntry]:
+    """Recursively yield matching files under root, skipping excluded directories.
+
+    Like os.walk, directories that can't be read (permissions, or removed or
+    renamed mid-scan) are skipped rather than ending the scan.
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError as e:
+                    logger.warning("scan_dir_failed", path=entry.path, error=str(e))
+                    continue
+
+                if is_dir:
+                    # Match os.walk: prune excluded directories, and list symlinked
+                    # directories but don't descend into them
+                    if entry.name not in settings.EXCLUDE_PATTERNS and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(settings.INCLUDE_EXTENSIONS):
+                    yield entry
+    except OSError as e:
+        logger.warning("scan_dir_failed", path=root, error=str(e))
+
+    for subdir in subdirs:
+        yield from iter_data_files(subdir)
+
+
 async def scan_existing_files(db_pool: asyncpg.Pool) -> None:
     """Scan existing files in ragbot-data on startup."""
     logger.info("scanning_existing_files", path=str(settings.RAGBOT_DATA_PATH))
 
     file_count = 0
-    for root, dirs, files in os.walk(settings.RAGBOT_DATA_PATH):
-        # Filter out excluded directories
-        dirs[:] = [d for d in dirs if d not in settings.EXCLUDE_PATTERNS]
+    # Every file discovered in this scan shares the same metadata
+    scan_metadata = {
+        'detected_by': 'initial_scan',
+        'scanned_at': datetime.now().isoformat()
+    }
 
-        for file in files:
-            if not any(file.endswith(ext) for ext in settings.INCLUDE_EXTENSIONS):
-                continue
+    # Strip the root prefix by slicing instead of Path.relative_to per file
+    root = str(settings.RAGBOT_DATA_PATH)
+    prefix_len = len(os.path.join(root, ''))
 
-            full_path = os.path.join(root, file)
-            relative_path = str(Path(full_path).relative_to(settings.RAGBOT_DATA_PATH))
+    for entry in iter_data_files(root):
+        full_path = entry.path
+        relative_path = full_path[prefix_len:]
 
-            try:
-                # Get file info
-                file_stat = os.stat(full_path)
-                file_size = file_stat.st_size
-                modified_at = datetime.fromtimestamp(file_stat.st_mtime)
+        try:
+            # Get file info (cached on the DirEntry, no extra stat call)
+            file_stat = entry.stat()
+            file_size = file_stat.st_size
+            modified_at = file_stat.st_mtime
+
+            async with db_pool.acquire() as conn:
+                # Skip hashing when size and mtime match the stored record
+                stored = await conn.fetchrow(UNCHANGED_HASH_SQL, relative_path, file_size, modified_at)
+                if stored:
+                    if stored['hash_alg'] != HASH_ALGORITHM:
+                        # Unchanged file with a legacy hash - rehash without re-queueing
+                        content_hash = await asyncio.to_thread(compute_file_hash, full_path)
+                        await conn.execute(
+                            UPGRADE_HASH_SQL, relative_path, content_hash, HASH_ALGORITHM
+                        )
+                    continue
 
                 # Compute hash
-                sha256_hash = hashlib.sha256()
-                with open(full_path, "rb") as f:
-                    for byte_block in iter(lambda: f.read(4096), b""):
-                        sha256_hash.update(byte_block)
-                content_hash = sha256_hash.hexdigest()
-
-                # Check if exists in database
-                async with db_pool.acquire() as conn:
-                    existing = await conn.fetchrow(
-                        "SELECT id, content_hash FROM ragbot_documents WHERE file_path = $1",
-                        relative_path
-                    )
-
-                    if not existing:
-                        # New file - insert and queue
-                        document_id = await conn.fetchval("""
-                            INSERT INTO ragbot_documents (
-                                file_path, content_hash, file_size, modified_at,
-                                embedding_status, metadata, created_at, updated_at
-                            )
-                            VALUES ($1, $2, $3, $4, 'pending', $5, NOW(), NOW())
-                            RETURNING id
-                        """, relative_path, content_hash, file_size, modified_at, {
-                            'detected_by': 'initial_scan',
-                            'scanned_at': datetime.now().isoformat()
-                        })
-
-                        await conn.execute("""
-                            INSERT INTO embedding_queue (document_type, document_id, priority, status)
-                            VALUES ('ragbot', $1, 5, 'pending')
-                        """, document_id)
-
-                        logger.debug("file_discovered", path=relative_path)
-                        file_count += 1
-
-                    elif existing['content_hash'] != content_hash:
-                        # File changed - update and requeue
-                        await conn.execute("""
-                            UPDATE ragbot_documents
-                            SET content_hash = $1,
-                                file_size = $2,
-                                modified_at = $3,
-                                embedding_status = 'pending',
-                                chunk_count = 0,
-                                indexed_at = NULL,
-                                error_message = NULL,
-                                updated_at = NOW()
-                            WHERE file_path = $4
-                        """, content_hash, file_size, modified_at, relative_path)
-
-                        await conn.execute("""
-                            INSERT INTO embedding_queue (document_type, document_id, priority, status)
-                            VALUES ('ragbot', $1, 5, 'pending')
-                        """, existing['id'])
-
-                        logger.debug("file_changed_on_startup", path=relative_path)
-                        file_count += 1
-
-            except Exception as e:
-                logger.error("scan_file_failed", path=relative_path, error=str(e))
+                content_hash = await asyncio.to_thread(compute_file_hash, full_path)
+
+                # Upsert and queue new or changed files
+                row = await conn.fetchrow(
+                    UPSERT_AND_QUEUE_SQL,
+                    relative_path, content_hash, file_size, modified_at, scan_metadata,
+                    5,  # Normal priority for the startup scan
+                    HASH_ALGORITHM
+                )
+
+            if row is not None:
+                if row['inserted']:
+                    logger.debug("file_discovered", path=relative_path)
+                else:
+                    logger.debug("file_changed_on_startup", path=relative_path)
+                file_count += 1
+
+        except Exception as e:
+            logger.error("scan_file_failed", path=relative_path, error=str(e))
 
     logger.info("initial_scan_complete", files_queued=file_count)
 
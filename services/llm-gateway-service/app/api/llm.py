@@ -1,59 +1,117 @@
 """LLM Gateway API routes."""
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List, Optional
-import sys
-import os
-
-sys.path.append("/app/../../..")
-
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import raiseload
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Hashable, List, Optional
+
+from app.core import settings, require_admin_token
 from app.db import get_db
 from app.schemas import (
     ChatRequest,
     ChatResponse,
     TokenCountRequest,
     TokenCountResponse,
+    BatchTokenCountRequest,
+    BatchTokenCountResponse,
     LLMProviderResponse,
     LLMModelResponse,
     ModelCostEstimateRequest,
     ModelCostEstimateResponse,
 )
-from app.utils import llm_client, count_tokens, count_messages_tokens
-from shared.models import LLMProvider, LLMModel
+from app.utils import (
+    llm_client,
+    count_tokens_async,
+    count_tokens_batch_async,
+    count_messages_tokens_async,
+)
+from shared.models import LLMProvider, LLMModel, ModelCategory
 
 router = APIRouter(prefix="/llm", tags=["llm"])
 
+# Providers and models change rarely, so read endpoints serve serialized
+# results from a short-lived in-process cache instead of querying per request.
+_catalog_cache: TTLCache = TTLCache(
+    maxsize=settings.CATALOG_CACHE_SIZE,
+    ttl=settings.CATALOG_CACHE_TTL
+)
+
+# Responses only use catalog columns (display_label is denormalized), so loads
+# skip the default LLMModel.provider join and any relationship access raises
+_no_relationships = raiseload("*")
+
+# Catalog listings stream from a server-side cursor in batches of this many rows,
+# so ORM objects are converted and released as they arrive
+_SCAN_BATCH_SIZE = 500
+
+
+def _cache_get(key: Hashable) -> Optional[Any]:
+    """Return a cached catalog response, or None on a miss."""
+    return _catalog_cache.get(key)
+
+
+def _cache_set(key: Hashable, value: Any) -> Any:
+    """Store a catalog response and return it."""
+    _catalog_cache[key] = value
+    return value
+
+
+def clear_catalog_cache() -> None:
+    """Invalidate cached provider/model responses (call after any catalog change)."""
+    _catalog_cache.clear()
+
+
+async def load_model_costs(db: AsyncSession) -> int:
+    """Load per-token model pricing from the database into the LLM client."""
+    result = await db.execute(
+        select(LLMModel.name, LLMModel.cost_per_input_token_pico, LLMModel.cost_per_output_token_pico)
+        .where(LLMModel.cost_per_input_token_pico.is_not(None))
+        .where(LLMModel.cost_per_output_token_pico.is_not(None))
+    )
+    prices = {name: (input_cost, output_cost) for name, input_cost, output_cost in result.all()}
+    llm_client.update_cost_table(prices)
+    return len(prices)
+
 
 @router.post("/chat", response_model=ChatResponse)
 async def chat_completion(
     request: ChatRequest,
-    db: Session = Depends(get_db)
+    http_request: Request,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Send a chat completion request to an LLM provider.
 
     This endpoint provides direct access to LLM providers via LiteLLM.
+    When `stream` is set, or the client sends `Accept: text/event-stream`, the
+    response is sent as Server-Sent Events: one `data:` frame per content delta,
+    then a final frame with usage and cost. Otherwise the full completion is
+    returned as a single ChatResponse.
     """
-    try:
-        # Convert message inputs to dict format
-        messages = [{"role": msg.role, "content": msg.content} for msg in request.messages]
+    # Convert message inputs to dict format
+    messages = [{"role": msg.role, "content": msg.content} for msg in request.messages]
+
+    if request.stream or "text/event-stream" in http_request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_chat_events(request, messages),
+            media_type="text/event-stream",
+            # An explicit encoding keeps GZipMiddleware from buffering the events
+            headers={"Content-Encoding": "identity"}
+        )
 
+    try:
         # Call LLM
         response = await llm_client.chat_completion(
             model=request.model,
             messages=messages,
             temperature=request.temperature,
             max_tokens=request.max_tokens,
-            stream=request.stream
+            stream=False
         )
 
-        if request.stream:
-            # TODO: Handle streaming responses
-            raise HTTPException(
-                status_code=status.HTTP_501_NOT_IMPLEMENTED,
-                detail="Streaming not yet implemented"
-            )
-
         # Calculate cost
         usage = response["usage"]
         cost = llm_client.calculate_cost(
@@ -77,6 +135,31 @@ async def chat_completion(
         )
 
 
+async def _stream_chat_events(request: ChatRequest, messages: list):
+    """Generate Server-Sent Events for a streaming chat completion."""
+    try:
+        async for chunk in llm_client.chat_completion_stream(
+            model=request.model,
+            messages=messages,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens
+        ):
+            if "usage" in chunk:
+                usage = chunk["usage"]
+                cost = llm_client.calculate_cost(
+                    model=request.model,
+                    prompt_tokens=usage["prompt_tokens"],
+                    completion_tokens=usage["completion_tokens"]
+                )
+                chunk["cost"] = str(cost) if cost is not None else None
+
+            yield b"data: " + orjson.dumps(chunk) + b"\n\n"
+
+    except Exception as e:
+        yield b"event: error\n"
+        yield b"data: " + orjson.dumps({"error": f"LLM request failed: {str(e)}"}) + b"\n\n"
+
+
 @router.post("/count-tokens", response_model=TokenCountResponse)
 async def count_tokens_endpoint(request: TokenCountRequest):
     """
@@ -86,10 +169,10 @@ async def count_tokens_endpoint(request: TokenCountRequest):
     """
     try:
         if request.text:
-            token_count = count_tokens(request.text)
+            token_count = await count_tokens_async(request.text)
         elif request.messages:
             messages = [{"role": msg.role, "content": msg.content} for msg in request.messages]
-            token_count = count_messages_tokens(messages, request.model)
+            token_count = await count_messages_tokens_async(messages, request.model)
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -108,6 +191,26 @@ async def count_tokens_endpoint(request: TokenCountRequest):
         )
 
 
+@router.post("/tokens/batch", response_model=BatchTokenCountResponse)
+async def count_tokens_batch_endpoint(request: BatchTokenCountRequest):
+    """
+    Count tokens for many texts in one request.
+
+    Tokenizes all texts in a single batched call instead of one request per text.
+    """
+    try:
+        return BatchTokenCountResponse(
+            counts=await count_tokens_batch_async(request.texts, request.model),
+            model=request.model
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Token counting failed: {str(e)}"
+        )
+
+
 @router.post("/estimate-cost", response_model=ModelCostEstimateResponse)
 async def estimate_cost(request: ModelCostEstimateRequest):
     """
@@ -137,29 +240,59 @@ async def estimate_cost(request: ModelCostEstimateRequest):
         )
 
 
+@router.post("/pricing/refresh", dependencies=[Depends(require_admin_token)])
+async def refresh_pricing(db: AsyncSession = Depends(get_db)):
+    """
+    Reload model pricing from the database.
+
+    Call after editing llm_models costs so cost estimates pick them up without a restart.
+    Clears the process-wide pricing and catalog caches, so it requires the
+    X-Admin-Token header.
+    """
+    model_count = await load_model_costs(db)
+    llm_client.clear_price_cache()
+    clear_catalog_cache()
+    return {"message": "Pricing refreshed", "models": model_count}
+
+
 @router.get("/providers", response_model=List[LLMProviderResponse])
 async def list_providers(
     include_inactive: bool = False,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     List all LLM providers.
 
     Returns a list of configured LLM providers (OpenAI, Anthropic, Google, etc.)
     """
-    query = db.query(LLMProvider)
+    cache_key = ("providers", include_inactive)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    query = select(LLMProvider).options(_no_relationships)
 
     if not include_inactive:
-        query = query.filter(LLMProvider.is_active == True)
+        query = query.where(LLMProvider.is_active == True)
 
-    providers = query.order_by(LLMProvider.name).all()
-    return providers
+    providers = await db.stream_scalars(
+        query.order_by(LLMProvider.name).execution_options(yield_per=_SCAN_BATCH_SIZE)
+    )
+    return _cache_set(cache_key, [LLMProviderResponse.model_validate(p) async for p in providers])
 
 
 @router.get("/providers/{provider_id}", response_model=LLMProviderResponse)
-async def get_provider(provider_id: int, db: Session = Depends(get_db)):
+async def get_provider(provider_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific LLM provider by ID."""
-    provider = db.query(LLMProvider).filter(LLMProvider.id == provider_id).first()
+    cache_key = ("provider", provider_id)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        select(LLMProvider).where(LLMProvider.id == provider_id).options(_no_relationships)
+    )
+    provider = result.scalar_one_or_none()
 
     if not provider:
         raise HTTPException(
@@ -167,40 +300,53 @@ async def get_provider(provider_id: int, db: Session = Depends(get_db)):
             detail="Provider not found"
         )
 
-    return provider
+    return _cache_set(cache_key, LLMProviderResponse.model_validate(provider))
 
 
 @router.get("/models", response_model=List[LLMModelResponse])
 async def list_models(
     provider_id: Optional[int] = None,
-    category: Optional[str] = None,
+    category: Optional[ModelCategory] = None,
     include_inactive: bool = False,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     List all available LLM models.
 
     Filter by provider, category, or active status.
     """
-    query = db.query(LLMModel)
+    cache_key = ("models", provider_id, category, include_inactive)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    query = select(LLMModel).options(_no_relationships)
 
     if provider_id:
-        query = query.filter(LLMModel.provider_id == provider_id)
+        query = query.where(LLMModel.provider_id == provider_id)
 
     if category:
-        query = query.filter(LLMModel.category == category)
+        query = query.where(LLMModel.category == category)
 
     if not include_inactive:
-        query = query.filter(LLMModel.is_active == True)
+        query = query.where(LLMModel.is_active == True)
 
-    models = query.order_by(LLMModel.category, LLMModel.name).all()
-    return models
+    models = await db.stream_scalars(
+        query.order_by(LLMModel.category, LLMModel.name).execution_options(yield_per=_SCAN_BATCH_SIZE)
+    )
+    return _cache_set(cache_key, [LLMModelResponse.model_validate(m) async for m in models])
 
 
 @router.get("/models/{model_id}", response_model=LLMModelResponse)
-async def get_model(model_id: int, db: Session = Depends(get_db)):
+async def get_model(model_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific LLM model by ID."""
-    model = db.query(LLMModel).filter(LLMModel.id == model_id).first()
+    cache_key = ("model", model_id)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(select(LLMModel).where(LLMModel.id == model_id).options(_no_relationships))
+    model = result.scalar_one_or_none()
 
     if not model:
         raise HTTPException(
@@ -208,13 +354,21 @@ async def get_model(model_id: int, db: Session = Depends(get_db)):
             detail="Model not found"
         )
 
-    return model
+    return _cache_set(cache_key, LLMModelResponse.model_validate(model))
 
 
 @router.get("/models/by-name/{model_name}", response_model=LLMModelResponse)
-async def get_model_by_name(model_name: str, db: Session = Depends(get_db)):
+async def get_model_by_name(model_name: str, db: AsyncSession = Depends(get_db)):
     """Get a specific LLM model by name."""
-    model = db.query(LLMModel).filter(LLMModel.name == model_name).first()
+    cache_key = ("model_by_name", model_name)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        select(LLMModel).where(LLMModel.name == model_name).options(_no_relationships).limit(1)
+    )
+    model = result.scalar_one_or_none()
 
     if not model:
         raise HTTPException(
@@ -222,4 +376,4 @@ async def get_model_by_name(model_name: str, db: Session = Depends(get_db)):
             detail=f"Model '{model_name}' not found"
         )
 
-    return model
+    return _cache_set(cache_key, LLMModelResponse.model_validate(model))
@@ -1,4 +1,6 @@
 """Core application components."""
 from .config import settings
+from .responses import ORJSONResponse
+from .security import require_admin_token
 
-__all__ = ["settings"]
+__all__ = ["settings", "ORJSONResponse", "require_admin_token"]
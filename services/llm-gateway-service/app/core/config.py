@@ -11,15 +11,37 @@ class Settings(BaseSettings):
     VERSION: str = "1.0.0"
     DEBUG: bool = True
     ENVIRONMENT: str = "development"
+    LOG_LEVEL: str = "INFO"
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_NULL_POOL: bool = False  # serverless: no pooled connections
+    DB_POOL_STATUS_INTERVAL: int = 300  # seconds; 0 disables pool status logging
 
     # Redis
     REDIS_URL: str
 
     # Auth
     AUTH_SERVICE_URL: str = "http://auth-service:8000"
+    # Shared secret for admin endpoints (X-Admin-Token header); unset disables them
+    GATEWAY_ADMIN_TOKEN: Optional[str] = None
+
+    # Provider/model catalog cache
+    CATALOG_CACHE_TTL: int = 60  # seconds
+    CATALOG_CACHE_SIZE: int = 256
+
+    # Exact-match response cache in Redis; 0 disables it
+    PROMPT_CACHE_TTL: int = 3600  # seconds
+
+    # Semantic response cache (requires sentence-transformers and faiss-cpu)
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_MODEL: str = "all-MiniLM-L6-v2"
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 10000
+    SEMANTIC_CACHE_MAX_TEMPERATURE: float = 0.3
 
     # LLM Provider API Keys
     OPENAI_API_KEY: Optional[str] = None
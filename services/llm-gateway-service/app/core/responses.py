@@ -0,0 +1,25 @@
+"""Response classes."""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson doesn't handle natively."""
+    if isinstance(obj, Decimal):
+        # Costs are Decimal; keep them exact rather than rounding through float
+        return str(obj)
+    raise TypeError
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """ORJSONResponse that also serializes Decimal values."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
@@ -0,0 +1,28 @@
+"""Access control for administrative endpoints."""
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from .config import settings
+
+
+async def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    Allow a request only if it carries the configured admin token.
+
+    Administrative endpoints are disabled entirely while GATEWAY_ADMIN_TOKEN is unset.
+    """
+    if not settings.GATEWAY_ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin endpoints are disabled"
+        )
+
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token.encode(), settings.GATEWAY_ADMIN_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token"
+        )
@@ -1,15 +1,32 @@
 """Main FastAPI application for LLM Gateway Service."""
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from prometheus_client import make_asgi_app
-import sys
+import logging
 import os
 
-# Add shared directory to path
-sys.path.append("/app/../../..")
+import structlog
 
 # Set API keys from environment
 from app.core.config import settings
+from app.core.responses import ORJSONResponse
+
+# Configure structured logging; events below LOG_LEVEL are dropped before formatting
+structlog.configure(
+    processors=[
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.add_log_level,
+        structlog.dev.ConsoleRenderer()
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(
+        logging.getLevelName(settings.LOG_LEVEL.upper())
+    )
+)
+logger = structlog.get_logger()
 
 # Set API keys for LLM providers
 if settings.OPENAI_API_KEY:
@@ -22,15 +39,80 @@ if settings.GEMINI_API_KEY:
     os.environ["GEMINI_API_KEY"] = settings.GEMINI_API_KEY
 
 from app.api import llm_router
+from app.api.llm import load_model_costs
+from app.db import AsyncSessionLocal, engine
+from app.utils import llm_client
+
+
+async def log_pool_status(interval: int) -> None:
+    """Periodically log database connection pool checkouts and overflow."""
+    while True:
+        await asyncio.sleep(interval)
+        logger.info("db_pool_status", status=engine.pool.status())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Lifespan events."""
+    # Startup
+    logger.info(
+        "service_starting",
+        name=settings.APP_NAME,
+        version=settings.VERSION,
+        environment=settings.ENVIRONMENT,
+        debug=settings.DEBUG
+    )
+
+    # Check which providers are configured
+    providers = [
+        name for name, api_key in (
+            ("OpenAI", settings.OPENAI_API_KEY),
+            ("Anthropic", settings.ANTHROPIC_API_KEY),
+            ("Google Gemini", settings.GEMINI_API_KEY),
+        )
+        if api_key
+    ]
+
+    if providers:
+        logger.info("providers_configured", providers=providers)
+    else:
+        logger.warning("no_providers_configured")
+
+    # Load model pricing once so cost calculations don't hit the database
+    try:
+        async with AsyncSessionLocal() as db:
+            model_count = await load_model_costs(db)
+        logger.info("model_pricing_loaded", models=model_count)
+    except Exception as e:
+        logger.warning("model_pricing_load_failed", error=str(e))
+
+    pool_monitor = None
+    if settings.DB_POOL_STATUS_INTERVAL > 0:
+        pool_monitor = asyncio.create_task(log_pool_status(settings.DB_POOL_STATUS_INTERVAL))
+
+    yield
+
+    # Shutdown
+    logger.info("service_stopping", name=settings.APP_NAME)
+    if pool_monitor is not None:
+        pool_monitor.cancel()
+    await engine.dispose()  # Close pooled database connections
+    await llm_client.close()
+
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
     debug=settings.DEBUG,
-    description="LLM Gateway Service for RaGenie - Unified interface to multiple LLM providers"
+    description="LLM Gateway Service for RaGenie - Unified interface to multiple LLM providers",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Compress larger JSON responses such as provider and model listings
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -74,31 +156,3 @@ async def health_check():
             bool(settings.GEMINI_API_KEY)
         ])
     }
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup."""
-    print(f"{settings.APP_NAME} v{settings.VERSION} starting up...")
-    print(f"Environment: {settings.ENVIRONMENT}")
-    print(f"Debug mode: {settings.DEBUG}")
-
-    # Check which providers are configured
-    providers = []
-    if settings.OPENAI_API_KEY:
-        providers.append("OpenAI")
-    if settings.ANTHROPIC_API_KEY:
-        providers.append("Anthropic")
-    if settings.GEMINI_API_KEY:
-        providers.append("Google Gemini")
-
-    if providers:
-        print(f"Configured providers: {', '.join(providers)}")
-    else:
-        print("WARNING: No LLM provider API keys configured!")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown."""
-    print(f"{settings.APP_NAME} shutting down...")
@@ -6,6 +6,8 @@ from .llm import (
     SimplePromptRequest,
     TokenCountRequest,
     TokenCountResponse,
+    BatchTokenCountRequest,
+    BatchTokenCountResponse,
     LLMProviderResponse,
     LLMModelResponse,
     ModelCostEstimateRequest,
@@ -19,6 +21,8 @@ __all__ = [
     "SimplePromptRequest",
     "TokenCountRequest",
     "TokenCountResponse",
+    "BatchTokenCountRequest",
+    "BatchTokenCountResponse",
     "LLMProviderResponse",
     "LLMModelResponse",
     "ModelCostEstimateRequest",
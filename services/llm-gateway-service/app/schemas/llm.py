@@ -77,6 +77,18 @@ class TokenCountResponse(BaseModel):
     model: str = Field(..., description="Model used for counting")
 
 
+class BatchTokenCountRequest(BaseModel):
+    """Batch token counting request schema."""
+    texts: List[str] = Field(..., description="Texts to count tokens for")
+    model: str = Field("gpt-4", description="Model for accurate token counting")
+
+
+class BatchTokenCountResponse(BaseModel):
+    """Batch token counting response schema."""
+    counts: List[int] = Field(..., description="Number of tokens for each text, in request order")
+    model: str = Field(..., description="Model used for counting")
+
+
 class LLMProviderResponse(BaseModel):
     """LLM provider response schema."""
     id: int
@@ -96,6 +108,7 @@ class LLMModelResponse(BaseModel):
     provider_id: int
     name: str
     display_name: str
+    display_label: str
     category: str
     max_input_tokens: int
     max_output_tokens: int
@@ -1,7 +1,11 @@
 """Utility functions."""
 from .token_counter import (
     count_tokens,
+    count_tokens_batch,
     count_messages_tokens,
+    count_tokens_async,
+    count_tokens_batch_async,
+    count_messages_tokens_async,
     format_document_block,
     wrap_documents,
     human_format_number,
@@ -10,7 +14,11 @@ from .llm_client import llm_client, LLMClient
 
 __all__ = [
     "count_tokens",
+    "count_tokens_batch",
     "count_messages_tokens",
+    "count_tokens_async",
+    "count_tokens_batch_async",
+    "count_messages_tokens_async",
     "format_document_block",
     "wrap_documents",
     "human_format_number",
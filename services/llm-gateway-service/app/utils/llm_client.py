@@ -1,10 +1,26 @@
 """LLM client utilities using LiteLLM."""
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from decimal import Decimal
-from litellm import completion, model_cost
+from litellm import acompletion, model_cost
 import litellm
+import orjson
+import redis.asyncio as redis
+import structlog
+import xxhash
 
-from .token_counter import count_messages_tokens
+from app.core.config import settings
+from .token_counter import count_messages_tokens, count_messages_tokens_async, count_tokens_async
+
+logger = structlog.get_logger()
+
+# Per-token prices are held as integer picodollars (10^-12 USD), so cost math is
+# exact int arithmetic. Scale 12 covers the database's Numeric(12, 10) prices.
+_COST_SCALE = 12
+
+
+def _to_cost_units(price: Any) -> int:
+    """Convert a per-token USD price to integer picodollars."""
+    return int(Decimal(str(price or 0)).scaleb(_COST_SCALE).to_integral_value())
 
 
 class LLMClient:
@@ -15,6 +31,77 @@ class LLMClient:
         # Enable verbose logging in development
         litellm.set_verbose = False
 
+        # Per-token (input, output) prices in picodollars keyed by model name,
+        # loaded from the llm_models table. Takes precedence over LiteLLM's pricing.
+        self.cost_table: Dict[str, Tuple[int, int]] = {}
+
+        # LiteLLM prices converted to picodollars on first use; None marks
+        # models LiteLLM has no pricing for
+        self._price_cache: Dict[str, Optional[Tuple[int, int]]] = {}
+
+        # prepare_messages builders keyed by
+        # (has_history, has_system_content, supports_system_role)
+        self._prepare_dispatch = {
+            (False, False, False): self._prep_history,
+            (False, False, True): self._prep_history,
+            (True, False, False): self._prep_history,
+            (True, False, True): self._prep_history,
+            (True, True, True): self._prep_history,
+            (False, True, True): self._prep_system,
+            (False, True, False): self._prep_system_as_user,
+            (True, True, False): self._prep_system_as_user,
+        }
+
+        # Exact-match response cache shared across gateway workers
+        self.redis_client = redis.from_url(settings.REDIS_URL)
+
+        # Semantic response cache; disabled unless configured and installed
+        self.cache_enabled = settings.SEMANTIC_CACHE_ENABLED
+        self.semantic_cache = None
+        if self.cache_enabled:
+            try:
+                from .semantic_cache import SemanticCache
+
+                self.semantic_cache = SemanticCache(
+                    model_name=settings.SEMANTIC_CACHE_MODEL,
+                    threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+                    max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES
+                )
+            except ImportError as e:
+                logger.warning("semantic_cache_unavailable", error=str(e))
+                self.cache_enabled = False
+
+    def update_cost_table(self, prices: Dict[str, Tuple[int, int]]) -> None:
+        """
+        Replace the per-model pricing table.
+
+        Args:
+            prices: Mapping of model name to (input, output) cost per token in
+                picodollars, as stored in llm_models
+        """
+        self.cost_table = dict(prices)
+
+    def clear_price_cache(self) -> None:
+        """Forget converted LiteLLM prices (call after LiteLLM's pricing changes)."""
+        self._price_cache.clear()
+
+    @staticmethod
+    def _prompt_cache_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        payload = orjson.dumps(
+            {"m": model, "msg": messages, "t": temperature, "mt": max_tokens},
+            option=orjson.OPT_SORT_KEYS
+        )
+        return "llm:" + xxhash.xxh3_128_hexdigest(payload)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self.redis_client.aclose()
+
     async def chat_completion(
         self,
         model: str,
@@ -38,8 +125,32 @@ class LLMClient:
         Returns:
             Dictionary containing response data
         """
+        use_prompt_cache = settings.PROMPT_CACHE_TTL > 0 and not stream and not kwargs
+        if use_prompt_cache:
+            prompt_cache_key = self._prompt_cache_key(model, messages, temperature, max_tokens)
+            try:
+                cached = await self.redis_client.get(prompt_cache_key)
+            except redis.RedisError as e:
+                logger.warning("prompt_cache_get_failed", error=str(e))
+                cached = None
+            if cached is not None:
+                return orjson.loads(cached)
+
+        # Only near-deterministic, non-streaming requests are safe to reuse
+        use_cache = (
+            self.cache_enabled
+            and not stream
+            and not kwargs
+            and temperature <= settings.SEMANTIC_CACHE_MAX_TEMPERATURE
+        )
+        if use_cache:
+            cache_partition = f"{model}:{max_tokens}"
+            cached, embedding = await self.semantic_cache.lookup(cache_partition, messages)
+            if cached is not None:
+                return cached
+
         try:
-            response = completion(
+            response = await acompletion(
                 model=model,
                 messages=messages,
                 temperature=temperature,
@@ -53,7 +164,7 @@ class LLMClient:
                 content = response.get('choices', [{}])[0].get('message', {}).get('content', '')
                 usage = response.get('usage', {})
 
-                return {
+                result = {
                     "content": content,
                     "model": response.get('model', model),
                     "usage": {
@@ -63,13 +174,111 @@ class LLMClient:
                     },
                     "finish_reason": response.get('choices', [{}])[0].get('finish_reason', 'unknown')
                 }
+
+                if use_prompt_cache:
+                    try:
+                        await self.redis_client.setex(
+                            prompt_cache_key, settings.PROMPT_CACHE_TTL, orjson.dumps(result)
+                        )
+                    except redis.RedisError as e:
+                        logger.warning("prompt_cache_set_failed", error=str(e))
+
+                if use_cache:
+                    self.semantic_cache.add(cache_partition, embedding, result)
+
+                return result
             else:
-                # For streaming, return the generator
+                # For streaming, return LiteLLM's async chunk iterator
                 return {"stream": response}
 
         except Exception as e:
             raise Exception(f"LLM API error: {str(e)}")
 
+    async def chat_completion_stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a chat completion from an LLM provider.
+
+        Args:
+            model: Model identifier (e.g., "gpt-4", "claude-3-sonnet")
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters for the model
+
+        Yields:
+            {"content": delta} for each content chunk, followed by one final
+            {"model", "usage", "finish_reason"} dictionary
+        """
+        try:
+            response = await acompletion(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **kwargs
+            )
+
+            response_model = model
+            finish_reason = "unknown"
+            parts = []
+
+            async for chunk in response:
+                response_model = getattr(chunk, "model", None) or response_model
+                if not chunk.choices:
+                    continue
+
+                choice = chunk.choices[0]
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+
+                delta = getattr(choice.delta, "content", None)
+                if delta:
+                    parts.append(delta)
+                    yield {"content": delta}
+
+        except Exception as e:
+            raise Exception(f"LLM API error: {str(e)}")
+
+        # Providers don't reliably report usage when streaming, so count locally
+        prompt_tokens = await count_messages_tokens_async(messages, model)
+        completion_tokens = await count_tokens_async("".join(parts))
+
+        yield {
+            "model": response_model,
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            },
+            "finish_reason": finish_reason
+        }
+
+    def _litellm_prices(self, model: str) -> Optional[Tuple[int, int]]:
+        """Look up LiteLLM's per-token prices for a model in picodollars."""
+        try:
+            return self._price_cache[model]
+        except KeyError:
+            pass
+
+        model_info = model_cost.get(model)
+        prices = None
+        if model_info is not None:
+            prices = (
+                _to_cost_units(model_info.get('input_cost_per_token')),
+                _to_cost_units(model_info.get('output_cost_per_token'))
+            )
+
+        self._price_cache[model] = prices
+        return prices
+
     def calculate_cost(
         self,
         model: str,
@@ -88,21 +297,17 @@ class LLMClient:
             Cost in USD as Decimal, or None if pricing not available
         """
         try:
-            # Get model pricing from LiteLLM
-            if model in model_cost:
-                model_info = model_cost[model]
-
-                input_cost_per_token = model_info.get('input_cost_per_token', 0)
-                output_cost_per_token = model_info.get('output_cost_per_token', 0)
-
-                total_cost = (
-                    Decimal(str(prompt_tokens)) * Decimal(str(input_cost_per_token)) +
-                    Decimal(str(completion_tokens)) * Decimal(str(output_cost_per_token))
-                )
+            # Prefer pricing configured in the database
+            prices = self.cost_table.get(model)
+            if prices is None:
+                # Fall back to model pricing from LiteLLM
+                prices = self._litellm_prices(model)
+                if prices is None:
+                    return None
 
-                return total_cost
-            else:
-                return None
+            input_units, output_units = prices
+            total_units = prompt_tokens * input_units + completion_tokens * output_units
+            return Decimal(total_units).scaleb(-_COST_SCALE)
 
         except Exception:
             return None
@@ -126,26 +331,34 @@ class LLMClient:
         Returns:
             List of formatted message dictionaries
         """
-        messages = []
-
-        # Add conversation history if provided
-        if conversation_history:
-            messages.extend(conversation_history)
-
-        # Handle system content
-        if system_content and system_content.strip():
-            if supports_system_role:
-                # Add as system message
-                if not conversation_history:  # Only add if not in history already
-                    messages.insert(0, {"role": "system", "content": system_content})
-            else:
-                # Add as user message for models that don't support system role
-                messages.insert(0, {"role": "user", "content": system_content})
+        has_system = bool(system_content and system_content.strip())
+        build = self._prepare_dispatch[
+            (bool(conversation_history), has_system, bool(supports_system_role))
+        ]
+        return build(prompt, system_content, conversation_history or [])
+
+    # Straight-line message builders for prepare_messages, one per message layout
+
+    @staticmethod
+    def _prep_history(prompt, system_content, history):
+        # No system content, or a system message is already part of the history
+        return [*history, {"role": "user", "content": prompt}]
 
-        # Add current user prompt
-        messages.append({"role": "user", "content": prompt})
+    @staticmethod
+    def _prep_system(prompt, system_content, history):
+        return [
+            {"role": "system", "content": system_content},
+            {"role": "user", "content": prompt}
+        ]
 
-        return messages
+    @staticmethod
+    def _prep_system_as_user(prompt, system_content, history):
+        # For models that don't support the system role
+        return [
+            {"role": "user", "content": system_content},
+            *history,
+            {"role": "user", "content": prompt}
+        ]
 
     def estimate_tokens(self, messages: List[Dict[str, str]], model: str) -> int:
         """
@@ -0,0 +1,108 @@
+"""Semantic response cache for chat completions."""
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Cache chat completion responses by embedding similarity of the request.
+
+    Requests are embedded with a sentence-transformer and looked up in a FAISS
+    inner-product index. Embeddings are L2-normalized, so the inner product is
+    the cosine similarity. Each cache partition (model and max_tokens) has its
+    own index so responses never cross models.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        threshold: float = 0.95,
+        max_entries: int = 10000
+    ):
+        """
+        Load the embedding model.
+
+        Args:
+            model_name: sentence-transformers model used to embed requests
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Entries per partition before it is reset
+
+        Raises:
+            ImportError: If sentence-transformers or faiss is not installed
+        """
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
+        self._faiss = faiss
+        self.encoder = SentenceTransformer(model_name)
+        self.dimension = self.encoder.get_sentence_embedding_dimension()
+        self.threshold = threshold
+        self.max_entries = max_entries
+
+        self._indexes: Dict[str, Any] = {}
+        self._responses: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _embed(self, messages: List[Dict[str, str]]) -> np.ndarray:
+        text = "\n".join(f"{m.get('role', '')}: {m.get('content', '')}" for m in messages)
+        return self.encoder.encode([text], normalize_embeddings=True).astype(np.float32)
+
+    def _lookup(
+        self,
+        partition: str,
+        messages: List[Dict[str, str]]
+    ) -> Tuple[Optional[Dict[str, Any]], np.ndarray]:
+        embedding = self._embed(messages)
+
+        with self._lock:
+            index = self._indexes.get(partition)
+            if index is None or index.ntotal == 0:
+                return None, embedding
+
+            scores, ids = index.search(embedding, 1)
+            if scores[0][0] >= self.threshold:
+                return dict(self._responses[partition][ids[0][0]]), embedding
+
+        return None, embedding
+
+    async def lookup(
+        self,
+        partition: str,
+        messages: List[Dict[str, str]]
+    ) -> Tuple[Optional[Dict[str, Any]], np.ndarray]:
+        """
+        Find a cached response for messages similar to these.
+
+        Embedding is CPU-bound, so it runs in a worker thread.
+
+        Args:
+            partition: Cache partition key
+            messages: Request messages
+
+        Returns:
+            (cached response or None, request embedding for add())
+        """
+        return await asyncio.to_thread(self._lookup, partition, messages)
+
+    def add(self, partition: str, embedding: np.ndarray, response: Dict[str, Any]) -> None:
+        """
+        Store a response under the embedding returned by lookup().
+
+        Args:
+            partition: Cache partition key
+            embedding: Request embedding
+            response: Response dictionary to return on later hits
+        """
+        with self._lock:
+            index = self._indexes.get(partition)
+            # IndexFlatIP can't evict single entries; start the partition over when full
+            if index is None or index.ntotal >= self.max_entries:
+                index = self._faiss.IndexFlatIP(self.dimension)
+                self._indexes[partition] = index
+                self._responses[partition] = []
+
+            index.add(embedding)
+            self._responses[partition].append(dict(response))
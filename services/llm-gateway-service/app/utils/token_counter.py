@@ -1,6 +1,64 @@
 """Token counting utilities."""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from functools import lru_cache
+
 import tiktoken
-from typing import List, Dict, Any
+from cachetools import LRUCache
+from typing import List, Dict, Any, Tuple
+
+# Token counts keyed by (namespace, digest of the input). Clients resend the same
+# system prompt and history every turn, so repeat counts skip tokenization. Keys
+# hold a 16-byte digest rather than the text to keep memory bounded.
+_token_count_cache: LRUCache = LRUCache(maxsize=4096)
+# Counting also runs in worker threads (see count_tokens_async), and LRUCache
+# reorders entries on every read, so all access goes through this lock.
+_token_count_cache_lock = threading.Lock()
+
+
+def _cache_key(namespace: str, payload: str) -> Tuple[str, bytes]:
+    """Build a token count cache key from a namespace and input text."""
+    return namespace, hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+# Per-message framing overhead as (tokens_per_message, tokens_per_name), keyed by
+# model family (the model name up to the first "-").
+_DEFAULT_TOKEN_RULE: Tuple[int, int] = (3, 1)
+_MODEL_TOKEN_RULES: Dict[str, Tuple[int, int]] = {
+    "gpt": (3, 1),
+    "claude": (3, 1),
+    "gemini": (3, 1),
+}
+
+
+@lru_cache(maxsize=16)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Get a tokenizer encoding by name, constructed once per process."""
+    return tiktoken.get_encoding(encoding_name)
+
+
+@lru_cache(maxsize=32)
+def _get_encoding_for_model(model: str) -> tiktoken.Encoding:
+    """Get the tokenizer encoding for a model, falling back to cl100k_base."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return _get_encoding("cl100k_base")
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Approximate a token count without a tokenizer.
+
+    Roughly 4 characters per token, plus a quarter token per space since word
+    boundaries tend to start new tokens. Both len() and str.count() run in C.
+    """
+    if not text:
+        return 0
+    return max(1, (len(text) + text.count(" ")) // 4)
 
 
 def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
@@ -14,12 +72,41 @@ def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
     Returns:
         Number of tokens
     """
+    cache_key = _cache_key(encoding_name, text)
+    with _token_count_cache_lock:
+        cached = _token_count_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        encoding = _get_encoding(encoding_name)
+        token_count = len(encoding.encode(text))
+    except Exception:
+        # Fallback to approximate counting if encoding fails
+        return _estimate_tokens(text)
+
+    with _token_count_cache_lock:
+        _token_count_cache[cache_key] = token_count
+    return token_count
+
+
+def count_tokens_batch(texts: List[str], model: str = "gpt-4") -> List[int]:
+    """
+    Count tokens for many texts in a single tokenizer call.
+
+    Args:
+        texts: The texts to count tokens for
+        model: The model name to determine encoding
+
+    Returns:
+        Number of tokens for each text, in input order
+    """
     try:
-        encoding = tiktoken.get_encoding(encoding_name)
-        return len(encoding.encode(text))
+        encoding = _get_encoding_for_model(model)
+        return [len(ids) for ids in encoding.encode_batch(texts, num_threads=os.cpu_count() or 1)]
     except Exception:
         # Fallback to approximate counting if encoding fails
-        return len(text) // 4  # Rough approximation: 1 token ≈ 4 characters
+        return [_estimate_tokens(text) for text in texts]
 
 
 def count_messages_tokens(messages: List[Dict[str, str]], model: str = "gpt-4") -> int:
@@ -36,32 +123,54 @@ def count_messages_tokens(messages: List[Dict[str, str]], model: str = "gpt-4")
     Returns:
         Total number of tokens
     """
+    cache_key = _cache_key(f"messages:{model}", json.dumps(messages, sort_keys=True))
+    with _token_count_cache_lock:
+        cached = _token_count_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    encoding = _get_encoding_for_model(model)
+
+    tokens_per_message, tokens_per_name = _MODEL_TOKEN_RULES.get(
+        model.split("-", 1)[0], _DEFAULT_TOKEN_RULE
+    )
+
+    # Encode every field in one batch call rather than one FFI call per field
+    values = [str(value) for message in messages for value in message.values()]
+    # tiktoken encodes in Rust without the GIL, so these threads run in parallel
+    # even inside the server process; one thread per field, up to 8
+    num_threads = min(8, max(1, len(values)))
     try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-    # Token calculation varies by model
-    if model.startswith("gpt-3.5-turbo") or model.startswith("gpt-4"):
-        tokens_per_message = 3
-        tokens_per_name = 1
-    else:
-        tokens_per_message = 3
-        tokens_per_name = 1
-
-    num_tokens = 0
-    for message in messages:
-        num_tokens += tokens_per_message
-        for key, value in message.items():
-            num_tokens += len(encoding.encode(str(value)))
-            if key == "name":
-                num_tokens += tokens_per_name
+        token_lengths = [len(ids) for ids in encoding.encode_batch(values, num_threads=num_threads)]
+    except Exception:
+        token_lengths = [len(encoding.encode(value)) for value in values]
+
+    num_tokens = sum(token_lengths)
+    num_tokens += tokens_per_message * len(messages)
+    num_tokens += tokens_per_name * sum(1 for message in messages if "name" in message)
 
     num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
 
+    with _token_count_cache_lock:
+        _token_count_cache[cache_key] = num_tokens
     return num_tokens
 
 
+async def count_tokens_async(text: str, encoding_name: str = "cl100k_base") -> int:
+    """Count tokens in a text string without blocking the event loop."""
+    return await asyncio.to_thread(count_tokens, text, encoding_name)
+
+
+async def count_tokens_batch_async(texts: List[str], model: str = "gpt-4") -> List[int]:
+    """Count tokens for many texts without blocking the event loop."""
+    return await asyncio.to_thread(count_tokens_batch, texts, model)
+
+
+async def count_messages_tokens_async(messages: List[Dict[str, str]], model: str = "gpt-4") -> int:
+    """Count tokens in a list of messages without blocking the event loop."""
+    return await asyncio.to_thread(count_messages_tokens, messages, model)
+
+
 def format_document_block(content: str, source: str, doc_type: str, index: int) -> str:
     """
     Format content as a document block (similar to v1 format).
@@ -98,7 +207,9 @@ def wrap_documents(documents: List[str]) -> str:
     if not documents:
         return ""
 
-    return "<documents>\n" + "\n".join(documents) + "\n</documents>"
+    # One join copies each block once; concatenating around an inner join copied
+    # the whole context twice more
+    return "\n".join(["<documents>", *documents, "</documents>"])
 
 
 def human_format_number(num: float) -> str:
@@ -1,33 +1,64 @@
 """User and Profile API endpoints."""
-from typing import List
+import time
+from typing import List, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
-
-# Import shared models
-import sys
-sys.path.append('/app/../../shared')
-from models.user import User
-from models.profile import Profile
+from sqlalchemy import bindparam, select, update, delete
+from sqlalchemy.orm import raiseload
 
 from app.db.database import get_db
 from app.schemas.user import UserResponse, ProfileCreate, ProfileUpdate, ProfileResponse
+from shared.models import User, Profile
 
 router = APIRouter()
 
+# Statements for the hot read paths, built once. Parameters are passed at
+# execution, so every request reuses the same statement and its compiled form.
+# Responses only use the entity's own columns: raiseload("*") skips the default
+# Profile.user join and makes any relationship access raise rather than query.
+_select_dev_user = select(User).options(raiseload("*")).limit(1)
+_select_profiles = (
+    select(Profile)
+    .where(Profile.user_id == bindparam("user_id"))
+    .options(raiseload("*"))
+    .order_by(Profile.created_at.desc())
+    # Streamed from a server-side cursor in batches rather than fetched whole
+    .execution_options(yield_per=500)
+)
+_select_profile = (
+    select(Profile)
+    .where(Profile.id == bindparam("profile_id"))
+    .where(Profile.user_id == bindparam("user_id"))
+    .options(raiseload("*"))
+)
+
+
+# Development-only user cache as (loaded_at, user). Remove once get_current_user
+# resolves users from auth tokens; key a short-TTL Redis cache by token then.
+_DEV_USER_TTL = 60.0  # seconds
+_dev_user_cache: Optional[Tuple[float, User]] = None
+
 
 # Dependency to get current user (simplified - would integrate with auth service)
 async def get_current_user(db: AsyncSession = Depends(get_db)) -> User:
     """Get current user from token (placeholder)."""
+    global _dev_user_cache
+
     # TODO: Integrate with auth service to validate JWT and get user
     # For now, return first user (development only)
-    result = await db.execute(select(User).limit(1))
+    if _dev_user_cache is not None and time.monotonic() - _dev_user_cache[0] < _DEV_USER_TTL:
+        return _dev_user_cache[1]
+
+    result = await db.execute(_select_dev_user)
     user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated"
         )
+
+    _dev_user_cache = (time.monotonic(), user)
     return user
 
 
@@ -36,7 +67,9 @@ async def get_current_user_info(
     current_user: User = Depends(get_current_user)
 ):
     """Get current user information."""
-    return current_user
+    # Returning the response directly skips FastAPI's second validation and
+    # jsonable_encoder pass; response_model still documents the shape
+    return ORJSONResponse(UserResponse.model_validate(current_user).model_dump())
 
 
 @router.get("/profiles", response_model=List[ProfileResponse])
@@ -45,13 +78,10 @@ async def list_profiles(
     db: AsyncSession = Depends(get_db)
 ):
     """List all profiles for current user."""
-    result = await db.execute(
-        select(Profile)
-        .where(Profile.user_id == current_user.id)
-        .order_by(Profile.created_at.desc())
-    )
-    profiles = result.scalars().all()
-    return profiles
+    profiles = await db.stream_scalars(_select_profiles, {"user_id": current_user.id})
+    return ORJSONResponse([
+        ProfileResponse.model_validate(profile).model_dump() async for profile in profiles
+    ])
 
 
 @router.post("/profiles", response_model=ProfileResponse, status_code=status.HTTP_201_CREATED)
@@ -84,9 +114,7 @@ async def get_profile(
 ):
     """Get a specific profile."""
     result = await db.execute(
-        select(Profile)
-        .where(Profile.id == profile_id)
-        .where(Profile.user_id == current_user.id)
+        _select_profile, {"profile_id": profile_id, "user_id": current_user.id}
     )
     profile = result.scalar_one_or_none()
 
@@ -96,7 +124,7 @@ async def get_profile(
             detail=f"Profile {profile_id} not found"
         )
 
-    return profile
+    return ORJSONResponse(ProfileResponse.model_validate(profile).model_dump())
 
 
 @router.put("/profiles/{profile_id}", response_model=ProfileResponse)
@@ -107,13 +135,25 @@ async def update_profile(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a profile."""
-    # Check profile exists and belongs to user
-    result = await db.execute(
-        select(Profile)
-        .where(Profile.id == profile_id)
-        .where(Profile.user_id == current_user.id)
-    )
-    profile = result.scalar_one_or_none()
+    update_data = profile_data.model_dump(exclude_unset=True)
+    owned = (Profile.id == profile_id) & (Profile.user_id == current_user.id)
+
+    if update_data:
+        # Ownership check and update in one round trip
+        result = await db.execute(
+            update(Profile)
+            .where(owned)
+            .values(**update_data)
+            .returning(Profile)
+        )
+        profile = result.scalar_one_or_none()
+        if profile:
+            await db.commit()
+    else:
+        result = await db.execute(
+            _select_profile, {"profile_id": profile_id, "user_id": current_user.id}
+        )
+        profile = result.scalar_one_or_none()
 
     if not profile:
         raise HTTPException(
@@ -121,15 +161,6 @@ async def update_profile(
             detail=f"Profile {profile_id} not found"
         )
 
-    # Update fields
-    update_data = profile_data.model_dump(exclude_unset=True)
-    if update_data:
-        for field, value in update_data.items():
-            setattr(profile, field, value)
-
-        await db.commit()
-        await db.refresh(profile)
-
     return profile
 
 
@@ -140,21 +171,20 @@ async def delete_profile(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a profile."""
-    # Check profile exists and belongs to user
+    # Ownership check and delete in one round trip
     result = await db.execute(
-        select(Profile)
+        delete(Profile)
         .where(Profile.id == profile_id)
         .where(Profile.user_id == current_user.id)
+        .returning(Profile.id)
     )
-    profile = result.scalar_one_or_none()
 
-    if not profile:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Profile {profile_id} not found"
         )
 
-    await db.delete(profile)
     await db.commit()
 
     return None
@@ -13,6 +13,10 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_NULL_POOL: bool = False  # serverless: no pooled connections
 
     # Redis
     REDIS_URL: str
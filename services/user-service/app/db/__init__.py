@@ -1,4 +1,4 @@
 """Database utilities."""
-from .database import engine, get_db, SessionLocal
+from .database import engine, get_db, AsyncSessionLocal
 
-__all__ = ["engine", "get_db", "SessionLocal"]
+__all__ = ["engine", "get_db", "AsyncSessionLocal"]
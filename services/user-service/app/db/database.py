@@ -1,26 +1,48 @@
 """Database connection and session management."""
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
-# Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
+# The async engine needs the asyncpg driver; accept plain postgresql:// URLs
+database_url = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+if settings.DB_NULL_POOL:
+    # Serverless deployments: open a connection per checkout and keep none idle
+    pool_options = {"poolclass": NullPool}
+else:
+    # LIFO checkout reuses the most recently returned connections, so a small
+    # warm set (with its prepared statements) serves most requests and the
+    # rest idle until recycled
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_use_lifo": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+# Create async database engine
+engine = create_async_engine(
+    database_url,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    query_cache_size=1200,  # Compiled statement cache (default 500)
+    # Keep the hot lookups prepared per connection; the caps bound
+    # per-connection memory
+    connect_args={"prepared_statement_cache_size": 500, "statement_cache_size": 500},
+    **pool_options
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Get database session dependency."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session dependency."""
+    async with AsyncSessionLocal() as session:
+        yield session
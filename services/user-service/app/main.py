@@ -1,6 +1,7 @@
 """User Service main application."""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
@@ -21,6 +22,7 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -0,0 +1 @@
+"""Shared models and schemas used across RaGenie services."""
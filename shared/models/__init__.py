@@ -5,7 +5,7 @@ from .user import User
 from .profile import Profile
 from .document import Document, DocumentType
 from .conversation import Conversation, Message, MessageRole
-from .llm import LLMProvider, LLMModel
+from .llm import LLMProvider, LLMModel, ModelCategory
 
 __all__ = [
     "Base",
@@ -19,4 +19,5 @@ __all__ = [
     "MessageRole",
     "LLMProvider",
     "LLMModel",
+    "ModelCategory",
 ]
\ No newline at end of file
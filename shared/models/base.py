@@ -2,13 +2,26 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, FetchedValue, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
-    pass
+
+    # Attributes shown by __repr__ after id
+    __repr_attrs__: tuple[str, ...] = ()
+
+    def __repr__(self) -> str:
+        # Only already-loaded values are read, so repr() never emits SQL (which
+        # fails outright on an async session) and skips attribute instrumentation
+        state = self.__dict__
+        fields = ", ".join(
+            "%s=%r" % (name, state[name])
+            for name in ("id",) + self.__repr_attrs__
+            if name in state
+        )
+        return "<%s(%s)>" % (type(self).__name__, fields)
 
 
 class TimestampMixin:
@@ -19,9 +32,11 @@ class TimestampMixin:
         server_default=func.now(),
         nullable=False
     )
+    # Bumped by the set_updated_at trigger on every UPDATE, so statements don't
+    # carry the column and bulk/Core updates can't forget it
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False
     )
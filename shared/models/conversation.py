@@ -47,14 +47,15 @@ class Conversation(Base, TimestampMixin):
     # LangGraph workflow state persistence
     state: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
-    # Relationships
+    # Relationships. Messages are removed by the ON DELETE CASCADE foreign key
     user: Mapped["User"] = relationship("User", back_populates="conversations")
     profile: Mapped[Optional["Profile"]] = relationship("Profile", back_populates="conversations")
     messages: Mapped[list["Message"]] = relationship(
         "Message",
         back_populates="conversation",
-        cascade="all, delete-orphan",
-        order_by="Message.created_at"
+        cascade="save-update, merge",
+        order_by="Message.created_at",
+        passive_deletes=True
     )
 
     def __repr__(self) -> str:
@@ -2,60 +2,120 @@
 from typing import Optional
 from decimal import Decimal
 
-from sqlalchemy import String, Text, Integer, ForeignKey, Boolean, Numeric, JSON
+from sqlalchemy import (
+    String, Text, Integer, BigInteger, ForeignKey, Boolean, Numeric, Identity, Index, FetchedValue, text, cast,
+    CheckConstraint, Double, Enum as SQLEnum
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+import enum
 
 from .base import Base, TimestampMixin
 
+# Token prices are stored as integer picodollars (10^-12 USD)
+PICODOLLARS_PER_USD = 10 ** 12
+
+
+def _pico_to_usd(pico: Optional[int]) -> Optional[Decimal]:
+    return None if pico is None else Decimal(pico).scaleb(-12)
+
+
+def _usd_to_pico(usd: Optional[Decimal]) -> Optional[int]:
+    return None if usd is None else int(Decimal(str(usd)).scaleb(12).to_integral_value())
+
 
 class LLMProvider(Base, TimestampMixin):
     """LLM Provider model for API configuration."""
 
     __tablename__ = "llm_providers"
+    __repr_attrs__ = ("name",)
+    __table_args__ = (
+        # Active provider listings, ordered by name
+        Index("ix_llm_providers_active_name", "name", postgresql_where=text("is_active")),
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Identity(always=True, cache=50), primary_key=True)
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
-    display_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    display_name: Mapped[str] = mapped_column(String(120), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # API configuration
-    api_endpoint: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    api_endpoint: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
     api_key_name: Mapped[str] = mapped_column(String(100), nullable=False)
 
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    # Provider-specific configuration stored as JSON
+    # Provider-specific configuration stored as JSONB
     # Example: {"supports_streaming": true, "supports_function_calling": true}
-    config: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    config: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
+        nullable=True,
+        deferred=True,  # Not loaded with the row; use undefer_group("config") when needed
+        deferred_group="config"
+    )
 
-    # Relationships
+    # Relationships. Never lazy loaded; use selectinload(LLMProvider.models)
     models: Mapped[list["LLMModel"]] = relationship(
         "LLMModel",
         back_populates="provider",
-        cascade="all, delete-orphan"
+        cascade="save-update, merge",
+        lazy="raise",
+        passive_deletes=True
     )
 
-    def __repr__(self) -> str:
-        return f"<LLMProvider(id={self.id}, name='{self.name}')>"
+
+class ModelCategory(str, enum.Enum):
+    """LLM model size/capability category."""
+    SMALL = "small"
+    MEDIUM = "medium"
+    LARGE = "large"
+    REASONING = "reasoning"
 
 
 class LLMModel(Base, TimestampMixin):
     """LLM Model model for available AI models."""
 
     __tablename__ = "llm_models"
+    __repr_attrs__ = ("name", "category")
+    __table_args__ = (
+        # Active models per provider (the model picker); also serves provider_id lookups
+        Index("ix_llm_models_provider_active", "provider_id", "is_active"),
+        Index("ix_llm_models_active_name", "name", postgresql_where=text("is_active")),
+        # Token limits stay Integer: current models allow more than 32767 output tokens
+        CheckConstraint("max_input_tokens > 0", name="ck_llm_models_max_input_tokens_positive"),
+        CheckConstraint("max_output_tokens > 0", name="ck_llm_models_max_output_tokens_positive"),
+        CheckConstraint("default_max_tokens > 0", name="ck_llm_models_default_max_tokens_positive"),
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Identity(always=True, cache=50), primary_key=True)
     provider_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("llm_providers.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Model identification
     name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    display_name: Mapped[str] = mapped_column(String(200), nullable=False)
-    category: Mapped[str] = mapped_column(String(50), nullable=False)  # small, medium, large, reasoning
+    display_name: Mapped[str] = mapped_column(String(120), nullable=False)
+    # "<provider display_name> / <display_name>", maintained by database triggers so
+    # listings don't need to join providers
+    display_label: Mapped[str] = mapped_column(
+        String(243),
+        nullable=False,
+        index=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue()
+    )
+    # Stored as the llm_model_category enum (4 bytes), keyed by the lowercase values
+    category: Mapped[ModelCategory] = mapped_column(
+        SQLEnum(
+            ModelCategory,
+            name="llm_model_category",
+            values_callable=lambda categories: [category.value for category in categories]
+        ),
+        nullable=False
+    )
 
     # Model capabilities
     max_input_tokens: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -64,27 +124,56 @@ class LLMModel(Base, TimestampMixin):
     supports_streaming: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Default parameters
-    default_temperature: Mapped[float] = mapped_column(Numeric(precision=3, scale=2), default=0.7, nullable=False)
+    default_temperature: Mapped[float] = mapped_column(Double, default=0.7, nullable=False)  # float, not Decimal
     default_max_tokens: Mapped[int] = mapped_column(Integer, default=4096, nullable=False)
 
-    # Pricing (per token)
-    cost_per_input_token: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(precision=12, scale=10),
-        nullable=True
-    )
-    cost_per_output_token: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(precision=12, scale=10),
-        nullable=True
-    )
+    # Pricing per token in picodollars; cost_per_*_token expose USD
+    cost_per_input_token_pico: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    cost_per_output_token_pico: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
 
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    # Model-specific configuration stored as JSON
+    # Model-specific configuration stored as JSONB
     # Example: {"context_window": 128000, "training_cutoff": "2024-04"}
-    config: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    config: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
+        nullable=True,
+        deferred=True,  # Not loaded with the row; use undefer_group("config") when needed
+        deferred_group="config"
+    )
 
-    # Relationships
-    provider: Mapped["LLMProvider"] = relationship("LLMProvider", back_populates="models")
+    # Relationships. The provider is loaded with the model in the same query
+    provider: Mapped["LLMProvider"] = relationship(
+        "LLMProvider",
+        back_populates="models",
+        lazy="joined",
+        innerjoin=True
+    )
 
-    def __repr__(self) -> str:
-        return f"<LLMModel(id={self.id}, name='{self.name}', category='{self.category}')>"
+    @hybrid_property
+    def cost_per_input_token(self) -> Optional[Decimal]:
+        """Input cost per token in USD."""
+        return _pico_to_usd(self.cost_per_input_token_pico)
+
+    @cost_per_input_token.inplace.setter
+    def _cost_per_input_token_setter(self, value: Optional[Decimal]) -> None:
+        self.cost_per_input_token_pico = _usd_to_pico(value)
+
+    @cost_per_input_token.inplace.expression
+    @classmethod
+    def _cost_per_input_token_expression(cls):
+        return cast(cls.cost_per_input_token_pico, Numeric(24, 12)) / PICODOLLARS_PER_USD
+
+    @hybrid_property
+    def cost_per_output_token(self) -> Optional[Decimal]:
+        """Output cost per token in USD."""
+        return _pico_to_usd(self.cost_per_output_token_pico)
+
+    @cost_per_output_token.inplace.setter
+    def _cost_per_output_token_setter(self, value: Optional[Decimal]) -> None:
+        self.cost_per_output_token_pico = _usd_to_pico(value)
+
+    @cost_per_output_token.inplace.expression
+    @classmethod
+    def _cost_per_output_token_expression(cls):
+        return cast(cls.cost_per_output_token_pico, Numeric(24, 12)) / PICODOLLARS_PER_USD
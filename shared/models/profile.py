@@ -1,7 +1,8 @@
 """Profile-related database models."""
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Text, Integer, ForeignKey, JSON
+from sqlalchemy import String, Text, Integer, ForeignKey, Identity, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -16,8 +17,13 @@ class Profile(Base, TimestampMixin):
     """Profile model for user preferences and configurations."""
 
     __tablename__ = "profiles"
+    __repr_attrs__ = ("name", "user_id")
+    __table_args__ = (
+        # Containment/key-existence queries on settings (@>, ?)
+        Index("ix_profiles_settings_gin", "settings", postgresql_using="gin"),
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Identity(always=True, cache=50), primary_key=True)
     user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -27,21 +33,28 @@ class Profile(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    # Settings stored as JSON
+    # Settings stored as JSONB
     # Example: {"default_model": "gpt-4", "temperature": 0.7, "max_tokens": 4096}
-    settings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-
-    # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="profiles")
+    settings: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+
+    # Relationships. The owner is loaded with the profile; collections never lazy
+    # load (use selectinload()) and deletes are left to the foreign keys.
+    user: Mapped["User"] = relationship(
+        "User",
+        back_populates="profiles",
+        lazy="joined",
+        innerjoin=True
+    )
     documents: Mapped[list["Document"]] = relationship(
         "Document",
         back_populates="profile",
-        cascade="all, delete-orphan"
+        cascade="save-update, merge",
+        lazy="raise",
+        passive_deletes=True
     )
     conversations: Mapped[list["Conversation"]] = relationship(
         "Conversation",
-        back_populates="profile"
+        back_populates="profile",
+        lazy="raise",
+        passive_deletes=True
     )
-
-    def __repr__(self) -> str:
-        return f"<Profile(id={self.id}, name='{self.name}', user_id={self.user_id})>"
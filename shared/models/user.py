@@ -2,44 +2,128 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, String, DateTime
+from sqlalchemy import CheckConstraint, Identity, Index, SmallInteger, String, DateTime, literal_column, text
+from sqlalchemy.dialects.postgresql import CITEXT
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
 
+# Bits of User.flags
+IS_ACTIVE = 1
+IS_VERIFIED = 2
+IS_SUPERUSER = 4
+DEFAULT_USER_FLAGS = IS_ACTIVE
+
 
 class User(Base, TimestampMixin):
     """User model for authentication and profile management."""
 
     __tablename__ = "users"
+    __repr_attrs__ = ("username",)  # email left out of logs
+    __table_args__ = (
+        # citext has no length modifier, so limits are enforced here
+        CheckConstraint("char_length(email) <= 254", name="ck_users_email_length"),  # RFC 5321
+        CheckConstraint("char_length(username) <= 64", name="ck_users_username_length"),
+        # Emails only need to be unique among active accounts; deactivated rows stay
+        # out of the unique index. ix_users_email still serves lookups of any user.
+        Index(
+            "ux_users_email_active",
+            "email",
+            unique=True,
+            postgresql_where=text("(flags & 1) <> 0")
+        ),
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
-    username: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False)
-    hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
+    id: Mapped[int] = mapped_column(Identity(always=True, cache=50), primary_key=True)
+    # Case-insensitive, so the unique indexes also treat Foo@x.com and foo@x.com as equal
+    email: Mapped[str] = mapped_column(CITEXT, index=True, nullable=False)
+    username: Mapped[str] = mapped_column(CITEXT, unique=True, index=True, nullable=False)
+    hashed_password: Mapped[str] = mapped_column(String(60), nullable=False)  # bcrypt
 
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Boolean status flags packed into one column; read them through the
+    # is_active / is_verified / is_superuser properties below
+    flags: Mapped[int] = mapped_column(
+        SmallInteger,
+        default=DEFAULT_USER_FLAGS,
+        server_default=text(str(DEFAULT_USER_FLAGS)),
+        nullable=False
+    )
 
     last_login: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    # Relationships
+    # Relationships. Collections never lazy load; callers must request them with
+    # selectinload(). Child rows are removed by the ON DELETE CASCADE foreign keys.
     profiles: Mapped[list["Profile"]] = relationship(
         "Profile",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="save-update, merge",
+        lazy="raise",
+        passive_deletes=True
     )
     documents: Mapped[list["Document"]] = relationship(
         "Document",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="save-update, merge",
+        lazy="raise",
+        passive_deletes=True
     )
     conversations: Mapped[list["Conversation"]] = relationship(
         "Conversation",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="save-update, merge",
+        lazy="raise",
+        passive_deletes=True
     )
 
-    def __repr__(self) -> str:
-        return f"<User(id={self.id}, username='{self.username}', email='{self.email}')>"
+    # The flag expressions below render the bit and the zero inline, e.g.
+    # (flags & 1) != 0, with no bound parameters. The planner can then prove they
+    # match partial index predicates such as ux_users_email_active's, including
+    # in the generic plans asyncpg's prepared statement cache ends up using
+
+    def _has_flag(self, bit: int) -> bool:
+        # flags is None on a new instance until it is flushed
+        return bool((DEFAULT_USER_FLAGS if self.flags is None else self.flags) & bit)
+
+    def _set_flag(self, bit: int, value: bool) -> None:
+        flags = DEFAULT_USER_FLAGS if self.flags is None else self.flags
+        self.flags = flags | bit if value else flags & ~bit
+
+    @hybrid_property
+    def is_active(self) -> bool:
+        return self._has_flag(IS_ACTIVE)
+
+    @is_active.inplace.setter
+    def _is_active_setter(self, value: bool) -> None:
+        self._set_flag(IS_ACTIVE, value)
+
+    @is_active.inplace.expression
+    @classmethod
+    def _is_active_expression(cls):
+        return cls.flags.op("&")(literal_column(str(IS_ACTIVE))) != literal_column("0")
+
+    @hybrid_property
+    def is_verified(self) -> bool:
+        return self._has_flag(IS_VERIFIED)
+
+    @is_verified.inplace.setter
+    def _is_verified_setter(self, value: bool) -> None:
+        self._set_flag(IS_VERIFIED, value)
+
+    @is_verified.inplace.expression
+    @classmethod
+    def _is_verified_expression(cls):
+        return cls.flags.op("&")(literal_column(str(IS_VERIFIED))) != literal_column("0")
+
+    @hybrid_property
+    def is_superuser(self) -> bool:
+        return self._has_flag(IS_SUPERUSER)
+
+    @is_superuser.inplace.setter
+    def _is_superuser_setter(self, value: bool) -> None:
+        self._set_flag(IS_SUPERUSER, value)
+
+    @is_superuser.inplace.expression
+    @classmethod
+    def _is_superuser_expression(cls):
+        return cls.flags.op("&")(literal_column(str(IS_SUPERUSER))) != literal_column("0")